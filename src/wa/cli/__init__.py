@@ -2,7 +2,6 @@ from .__main__ import app
 from .options import WorkspaceOption
 from .version import register_version
 
-from wa.mcp.cli import app as mcp_app
 from wa.workspace.cli import (
     register_create,
     register_delete,
@@ -12,7 +11,7 @@ from wa.workspace.cli import (
 
 __all__ = ["WorkspaceOption"]
 
-app.add_typer(mcp_app, name="mcp", short_help="MCP Installation and Development tools")
+# `mcp` sub-app is imported on demand by `LazyTyperGroup`.
 
 _ = register_create(app)
 _ = register_delete(app)
@@ -1,14 +1,42 @@
+import importlib
 import sys
 import typer
 
 from rich.console import Console
 from rich import print as rprint
+from typer.core import TyperGroup
+
+
+class LazyTyperGroup(TyperGroup):
+    """
+    Typer group that only imports sub-apps when they are requested.
+    Maps command name to the module providing `app` and its short help.
+    """
+
+    lazy_subcommands: dict[str, tuple[str, str]] = {
+        "mcp": ("wa.mcp.cli", "MCP Installation and Development tools"),
+    }
+
+    def list_commands(self, ctx):
+        return super().list_commands(ctx) + list(self.lazy_subcommands)
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.lazy_subcommands:
+            return super().get_command(ctx, cmd_name)
+
+        module_name, short_help = self.lazy_subcommands[cmd_name]
+        command = typer.main.get_command(importlib.import_module(module_name).app)
+        command.name = cmd_name
+        command.short_help = short_help
+        return command
+
 
 app = typer.Typer(
     name="workspace-agent",
     help="Utilize tool calling to manage workspace folders and subfolders",
     add_completion=False,
     no_args_is_help=True,
+    cls=LazyTyperGroup,
 )
 
 
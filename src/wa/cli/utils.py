@@ -12,12 +12,15 @@ from .options import WorkspaceOption
 
 
 def print_list(name: str, values: list[str] | None = None):
-    rprint(f"\n  {name}:")
+    # Rendered with a single `rprint` call rather than one per line.
+    lines = [f"\n  {name}:"]
     if values is None:
-        rprint(f"  ⚠️  [yellow]No {name} found.[/yellow]")
+        lines.append(f"  ⚠️  [yellow]No {name} found.[/yellow]")
     else:
-        for index, value in enumerate(values):
-            rprint(f"  {index + 1}. [cyan]{value}[/cyan]")
+        lines.extend(
+            f"  {index}. [cyan]{value}[/cyan]" for index, value in enumerate(values, 1)
+        )
+    rprint("\n".join(lines))
 
 
 def get_workspace(
@@ -38,14 +41,14 @@ def get_workspace(
 
     workspace_config_path = workspace_dir / config_file
 
-    if not workspace_config_path.exists():
+    try:
+        return Workspace.load(workspace_config_path)
+    except FileNotFoundError:
         rprint(
             f"❌ [red]This is not a valid workspace folder. `{workspace_config_path}` not found.[/red]"
         )
         raise typer.Exit(code=1)
 
-    return Workspace.load(workspace_config_path)
-
 
 @deprecated("Use get_workspace instead")
 def get_workspace_path(
@@ -1,20 +1,21 @@
-import importlib.metadata
 import typer
 
 from rich import print as rprint
 
+from wa import __version__
+
 
 def register_version(app: typer.Typer):
     @app.command()
     def version() -> None:
         """Show the installed version of `workspace-agent` package."""
-        try:
-            version = importlib.metadata.version("workspace-agent")
-            rprint(f"✅ workspace-agent version {version}")
-        except importlib.metadata.PackageNotFoundError:
+        # Read from package metadata once, when `wa` is imported.
+        if __version__ == "unknown":
             rprint(
                 "⚠️  [yellow]workspace-agent version unknown (package not installed)[/yellow]"
             )
             raise typer.Exit()
 
+        rprint(f"✅ workspace-agent version {__version__}")
+
     return version
@@ -1,12 +1,26 @@
+import base64
+import functools
 import importlib.util
-import re
 
 from datetime import datetime
 from pathlib import Path
 
+# Replaces spaces and removes characters not allowed in file or folder names
+# (including control characters) in a single `str.translate` pass.
+_PATHNAME_TABLE = str.maketrans(
+    {" ": "_", **{c: None for c in '<>:"/\\|?*'}, **{chr(i): None for i in range(32)}}
+)
+# Characters `_PATHNAME_TABLE` rewrites, most names contain none of them.
+_PATHNAME_CHARS = frozenset(map(chr, _PATHNAME_TABLE))
 
+
+@functools.lru_cache(maxsize=1)
 def get_project_root(parents_index: int = 4) -> Path:
-    """Find project root based on package installation location."""
+    """
+    Find project root based on package installation location.
+    Result is cached for the lifetime of the process, use
+    `get_project_root.cache_clear()` to reset.
+    """
     try:
         spec = importlib.util.find_spec("wa")
         if spec and spec.origin:
@@ -27,15 +41,17 @@ def get_project_root(parents_index: int = 4) -> Path:
     return Path.cwd()
 
 
+@functools.lru_cache(maxsize=4096)
 def create_pathname(name: str) -> str:
     """
-    Sanitizes name to use for file or folder name
+    Sanitizes name to use for file or folder name.
+    Results are cached since the same folder names recur across validations.
     """
 
-    name = name.replace(" ", "_")
-    name = re.sub(r'[<>:"/\\|?*\x00-\x1F]', "", name)
+    if _PATHNAME_CHARS.isdisjoint(name):
+        return name[:255]
 
-    return name[:255]
+    return name.translate(_PATHNAME_TABLE)[:255]
 
 
 def append_timestamp_to_name_or_path(
@@ -45,13 +61,29 @@ def append_timestamp_to_name_or_path(
     Appends year, month, day, hour, minute, second timestamp to provided string,
     Path (to the last component), or last string in list of strings.
     """
+    # Format only the timestamp, names may contain `%` which `strftime` would
+    # otherwise treat as directives.
+    timestamp = datetime.now().strftime("_%Y%m%d_%H%M%S")
+
     if isinstance(name_or_path, str):
-        return datetime.now().strftime(f"{name_or_path}_%Y%m%d_%H%M%S")
+        return name_or_path + timestamp
     elif isinstance(name_or_path, Path):
         # Append timestamp to the last component of the Path
-        last_part = name_or_path.name
-        timestamped_name = datetime.now().strftime(f"{last_part}_%Y%m%d_%H%M%S")
-        return name_or_path.parent / timestamped_name
+        return name_or_path.parent / (name_or_path.name + timestamp)
     elif isinstance(name_or_path, list):
-        name_or_path[-1] = datetime.now().strftime(f"{name_or_path[-1]}_%Y%m%d_%H%M%S")
+        name_or_path[-1] = name_or_path[-1] + timestamp
         return name_or_path
+
+
+def read_file_base64(path: Path, chunk_size: int = 57 * 1024) -> str:
+    """
+    Reads file at path and returns its contents base64 encoded.
+    """
+    # Encode in chunks (multiple of 3 bytes so no padding mid-stream) so only
+    # one raw chunk is read at a time. The encoded chunks and the joined result
+    # are still held together briefly, callers need the whole string anyway.
+    chunks = []
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            chunks.append(base64.b64encode(chunk).decode("ascii"))
+    return "".join(chunks)
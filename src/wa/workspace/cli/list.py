@@ -1,15 +1,25 @@
 import typer
 
+from typing_extensions import Annotated
+
 from wa.cli.utils import print_list
 from wa.workspace.list import list_workspaces
 
 
 def register_list(app: typer.Typer):
-
     @app.command(name="list")
-    def list() -> None:
+    def list(
+        workers: Annotated[
+            int | None,
+            typer.Option(
+                "--workers",
+                min=1,
+                help="Check workspace configs with this many threads (for network filesystems)",
+            ),
+        ] = None,
+    ) -> None:
         """List created workspaces."""
-        workspace_names = list_workspaces()
+        workspace_names = list_workspaces(max_workers=workers)
         print_list("Workspaces", workspace_names)
 
     return list
@@ -21,17 +21,17 @@ def create_workspace(
     if workspaces_path is None:
         workspaces_path = get_project_root() / "workspaces"
 
-    # Create the `out` directory if it doesn't exist.
-    workspaces_path.mkdir(parents=True, exist_ok=True)
-
-    workspace_path = workspaces_path / workspace_name
-
-    if workspace_path.exists() and not force:
-        raise FileExistsError("Workspace already exists")
-
     workspace = Workspace(
         name=workspace_name, workspaces_path=workspaces_path, **kwargs
     )
+
+    # Creating the folder doubles as the existence check (along with any
+    # missing `workspaces` parent folder).
+    try:
+        workspace.path.mkdir(parents=True, exist_ok=force)
+    except FileExistsError:
+        raise FileExistsError("Workspace already exists")
+
     workspace.save()
 
     return workspace
@@ -53,14 +53,18 @@ def create_workspace_folder(
 
     workspace_path = workspaces_path / workspace_name
 
-    # Creates workspace if not existant.
-    if not workspace_path.exists():
-        workspace = create_workspace(
+    try:
+        workspace = read_workspace(
             workspace_name=workspace_name,
             workspaces_path=workspaces_path,
         )
-    else:
-        workspace = read_workspace(
+    except FileNotFoundError:
+        # Existing workspace folder is missing its config, don't paper over it.
+        if workspace_path.exists():
+            raise
+
+        # Creates workspace if not existant.
+        workspace = create_workspace(
             workspace_name=workspace_name,
             workspaces_path=workspaces_path,
         )
@@ -1,8 +1,24 @@
+import json
+import os
 import shutil
+import subprocess
+import sys
 
 from pathlib import Path
 
-from .read import read_workspace
+from wa.utils import get_project_root
+
+
+def _remove_tree(path: Path) -> None:
+    """
+    Removes directory tree at path, opting into `rm -rf` with `WA_FAST_DELETE=1`.
+    """
+    # coreutils `rm` walks and unlinks the tree in C, which is noticeably faster
+    # than `shutil.rmtree` for workspaces with many files.
+    if os.environ.get("WA_FAST_DELETE") == "1" and sys.platform != "win32":
+        subprocess.run(["rm", "-rf", "--", str(path)], check=True)
+    else:
+        shutil.rmtree(path)
 
 
 def delete_workspace(
@@ -13,16 +29,34 @@ def delete_workspace(
     """
     Deletes entire workspace folder and subfolders.
     """
-    workspace = read_workspace(
-        workspace_name=workspace_name, workspaces_path=workspaces_path
-    )
+    if workspaces_path is None:
+        workspaces_path = get_project_root() / "workspaces"
+
+    workspace_path = workspaces_path / workspace_name
+    workspace_file = workspace_path / "workspace.json"
+
+    if force:
+        # Folders are deleted regardless, so skip loading and validating config.
+        if not workspace_file.exists():
+            raise FileNotFoundError(
+                f"Config file (`workspace.json`) for workspace `{workspace_name}` does not exist."
+            )
+
+    else:
+        # Only the recorded folders are needed, so skip validating the full
+        # Workspace model and just look them up in the raw config.
+        try:
+            config = json.loads(workspace_file.read_bytes())
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Config file (`workspace.json`) for workspace `{workspace_name}` does not exist."
+            )
 
-    if not force:
-        if len(workspace.folders) > 0:
+        if config.get("folders"):
             raise FileExistsError(
                 "Workspace currently has folders, use --force to delete"
             )
 
-    shutil.rmtree(workspace.path)
+    _remove_tree(workspace_path)
 
-    return workspace.path
+    return workspace_path
@@ -1,34 +1,55 @@
 import os
 
+from concurrent.futures import ThreadPoolExecutor
+from os import DirEntry
 from pathlib import Path
 
 from wa.utils import get_project_root
 
 
-def list_workspaces(workspaces_path: Path | None = None) -> list[str] | None:
+def _has_workspace_config(entry: DirEntry) -> bool:
+    return os.path.exists(os.path.join(entry.path, "workspace.json"))
+
+
+def list_workspaces(
+    workspaces_path: Path | None = None,
+    max_workers: int | None = None,
+) -> list[str]:
     """
     Lists workspace directories with config file under workspaces folder.
     Doesn't load the workspace object and doesn't validate the config.
     Intended for getting a list of all workspaces.
+
+    Config lookups run serially unless `max_workers` is given, then they are
+    spread over that many threads, which only pays off on slow (network)
+    filesystems.
     """
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}.")
+
     if workspaces_path is None:
         workspaces_path = get_project_root() / "workspaces"
 
-    if not workspaces_path.exists():
-        os.makedirs(workspaces_path)
+    # Creates the workspaces folder if missing, raises if path is not a folder.
+    try:
+        workspaces_path.mkdir(parents=True, exist_ok=True)
+    except FileExistsError:
+        raise FileNotFoundError(f"Workspaces path `{workspaces_path}` is not a folder.")
 
-    if not workspaces_path.is_dir():
-        raise FileNotFoundError
+    # `os.scandir` provides entry types from the directory listing itself, so
+    # only the config file lookup (and symlinked entries) need an extra stat.
+    with os.scandir(workspaces_path) as entries:
+        workspace_dirs = [entry for entry in entries if entry.is_dir()]
 
-    workspaces = []
-    for workspace_dir in workspaces_path.iterdir():
-        if workspace_dir.is_dir():
-            workspace_config_path = workspace_dir / "workspace.json"
-            if workspace_config_path.exists():
-                workspaces.append(workspace_dir.name)
+    # Starting threads costs more than local stat calls, opt in to overlap them.
+    if max_workers is not None:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            has_config = list(executor.map(_has_workspace_config, workspace_dirs))
+    else:
+        has_config = [_has_workspace_config(entry) for entry in workspace_dirs]
 
     return [
-        workspace_dir.name
-        for workspace_dir in workspaces_path.iterdir()
-        if workspace_dir.is_dir()
+        entry.name
+        for entry, is_workspace in zip(workspace_dirs, has_config)
+        if is_workspace
     ]
@@ -1,9 +1,11 @@
-import base64
 import json
+import stat
 from pathlib import Path
 
 from mcp.server import FastMCP
 
+from wa.utils import read_file_base64
+
 
 def register_workspace_resources(app: FastMCP):
     from wa import Workspace
@@ -30,11 +32,13 @@ def register_workspace_resources(app: FastMCP):
         """
         file_path = Path(path)
 
-        # Check if file exists
-        if not file_path.exists():
+        # Check if file exists, a single `stat()` answers both checks.
+        try:
+            file_mode = file_path.stat().st_mode
+        except (FileNotFoundError, NotADirectoryError):
             return {"error": f"File not found: {path}"}
 
-        if not file_path.is_file():
+        if not stat.S_ISREG(file_mode):
             return {"error": f"Path is not a file: {path}"}
 
         # Get file extension
@@ -43,8 +47,7 @@ def register_workspace_resources(app: FastMCP):
         # Handle PNG images
         if extension == ".png":
             try:
-                with open(file_path, "rb") as f:
-                    image_data = base64.b64encode(f.read()).decode("utf-8")
+                image_data = read_file_base64(file_path)
                 return {
                     "type": "image",
                     "mimeType": "image/png",
@@ -57,8 +60,7 @@ def register_workspace_resources(app: FastMCP):
         # Handle JSON files
         elif extension == ".json":
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    json_data = json.load(f)
+                json_data = json.loads(file_path.read_bytes())
                 return {
                     "type": "json",
                     "data": json_data,
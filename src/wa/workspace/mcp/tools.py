@@ -1,3 +1,7 @@
+import json
+import shutil
+import stat
+
 from mcp.server import FastMCP
 
 from pathlib import Path
@@ -10,6 +14,7 @@ def register_workspace_tools(app: FastMCP):
     from wa.mcp.types import ToolSuccess, ToolError
     from wa.mcp.utils import tool_success, tool_error
     from wa import Workspace, WorkspaceFolder
+    from wa.utils import read_file_base64
 
     @app.tool(
         title="Workspace Management",
@@ -156,23 +161,20 @@ def register_workspace_tools(app: FastMCP):
             For 'copy' method:
                 - {"source": "<source_path>", "destination": "<destination_path>", "copied": true}
         """
-        import base64
-        import json
-        import shutil
-        from pathlib import Path
-
         try:
             file_path = Path(path)
 
-            # Check if file exists
-            if not file_path.exists():
+            # Check if file exists, a single `stat()` answers both checks.
+            try:
+                file_mode = file_path.stat().st_mode
+            except (FileNotFoundError, NotADirectoryError):
                 return tool_error(
                     f"File not found: {path}",
                     "FILE_NOT_FOUND",
                     path=path,
                 )
 
-            if not file_path.is_file():
+            if not stat.S_ISREG(file_mode):
                 return tool_error(
                     f"Path is not a file: {path}",
                     "INVALID_PATH",
@@ -215,8 +217,7 @@ def register_workspace_tools(app: FastMCP):
 
                 # Handle PNG images
                 if extension == ".png":
-                    with open(file_path, "rb") as f:
-                        image_data = base64.b64encode(f.read()).decode("utf-8")
+                    image_data = read_file_base64(file_path)
                     return tool_success(
                         {
                             "type": "image",
@@ -228,8 +229,7 @@ def register_workspace_tools(app: FastMCP):
 
                 # Handle JSON files
                 elif extension == ".json":
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        json_data = json.load(f)
+                    json_data = json.loads(file_path.read_bytes())
                     return tool_success(
                         {
                             "type": "json",
@@ -1,14 +1,29 @@
 from __future__ import annotations
 
+import os
+import stat
+import tempfile
+
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
-from pydantic import Field, model_validator
+from pydantic import Field, PrivateAttr, model_validator
+from typing import Iterator
 
 from wa import __version__
-from wa.utils import get_project_root
+from wa.utils import (
+    append_timestamp_to_name_or_path,
+    create_pathname,
+    get_project_root,
+)
 
 from .workspace_base_model import WorkspaceBaseModel
 from .workspace_folder import WorkspaceFolder
 
+# Read once, setting the umask is the only way to query it and isn't thread-safe.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 class Workspace(WorkspaceBaseModel):
     """
@@ -19,6 +34,9 @@ class Workspace(WorkspaceBaseModel):
     workspaces_path: Path = Path("")
     config_file: str = "workspace.json"
 
+    _defer_save: bool = PrivateAttr(default=False)
+    _save_pending: bool = PrivateAttr(default=False)
+
     @model_validator(mode="after")
     def populate_missing_paths(self) -> "Workspace":
         if not self.workspaces_path:
@@ -36,26 +54,31 @@ class Workspace(WorkspaceBaseModel):
         force: bool = False,
     ) -> None:
         """
-        Recursively merge new folder structure into existing folder.
+        Merge new folder structure into existing folder.
 
         Args:
             existing: The existing WorkspaceFolder to merge into.
             new: The new WorkspaceFolder to merge from.
             force: Whether to overwrite existing folders.
         """
-        # Merge the nested subfolders from new into existing
-        for index, (name, new_nested) in enumerate(new.folders.items()):
-            if name in existing.folders:
-                # Copy path from existing folder to new folder
-                new_nested.path = existing.folders[name].path
-                # Recursively merge if nested subfolder already exists
-                # TODO: Add in overwrite check.
-                self._merge_folders(existing.folders[name], new_nested, force=force)
-            else:
-                # Add the new nested subfolder
-                new_nested.path = existing.path / name
-                new_nested.initialize(force=force)
-                existing.folders[name] = new_nested
+        # Pairs of (existing, new) folders left to merge, one per tree level
+        stack = [(existing, new)]
+        while stack:
+            existing, new = stack.pop()
+
+            # Merge the nested subfolders from new into existing
+            for name, new_nested in new.folders.items():
+                if name in existing.folders:
+                    # Copy path from existing folder to new folder
+                    new_nested.path = existing.folders[name].path
+                    # Merge the next level if nested subfolder already exists
+                    # TODO: Add in overwrite check.
+                    stack.append((existing.folders[name], new_nested))
+                else:
+                    # Add the new nested subfolder
+                    new_nested.path = existing.path / name
+                    new_nested.initialize(force=force)
+                    existing.folders[name] = new_nested
 
     def _get_deepest_folder(self, folder: WorkspaceFolder) -> WorkspaceFolder:
         """
@@ -67,10 +90,9 @@ class Workspace(WorkspaceBaseModel):
         Returns:
             The deepest nested folder.
         """
-        if folder.folders:
-            # Get the first (and should be only) nested subfolder
-            nested = next(iter(folder.folders.values()))
-            return self._get_deepest_folder(nested)
+        # Descend through the first (and should be only) nested subfolder
+        while folder.folders:
+            folder = next(iter(folder.folders.values()))
         return folder
 
     def create_folder(
@@ -87,38 +109,31 @@ class Workspace(WorkspaceBaseModel):
             name_or_path: Folder name, Path (relative to workspace), or list of folder names for nested structure.
             append_timestamp: Whether to append timestamp to the folder name.
             force: Overwrite existing folder.
-            **kwargs: Additional arguments to pass to WorkspaceFolder.
+            **kwargs: Additional arguments to pass to the (deepest) WorkspaceFolder.
 
         Returns:
             WorkspaceFolder: The created folder (deepest nested folder if nested).
         """
-        from wa.utils import append_timestamp_to_name_or_path
-
         if append_timestamp:
             name_or_path = append_timestamp_to_name_or_path(name_or_path)
 
         # Build WorkspaceFolder from name_or_path
         if isinstance(name_or_path, str):
-            workspace_folder = WorkspaceFolder(name=name_or_path, **kwargs)
+            workspace_folder = leaf = WorkspaceFolder(name=name_or_path, **kwargs)
         elif isinstance(name_or_path, Path):
             # Convert Path to list of parts to handle nested paths properly
             name_or_path = list(name_or_path.parts)
 
         # Handle both list (original) and Path (converted to list above)
         if isinstance(name_or_path, list):
-            folder_names = name_or_path.copy()
-            folder_names.reverse()
-
-            for index, name in enumerate(folder_names):
-                if index == 0:
-                    workspace_folder = WorkspaceFolder(name=name, **kwargs)
-                else:
-                    folders = {
-                        workspace_folder.name: workspace_folder,
-                    }
-                    workspace_folder = WorkspaceFolder(
-                        name=name, folders=folders, **kwargs
-                    )
+            # Build the chain from the deepest folder outwards. Only the deepest
+            # folder is validated with kwargs, parent folders just wrap it.
+            workspace_folder = leaf = WorkspaceFolder(name=name_or_path[-1], **kwargs)
+            for name in islice(reversed(name_or_path), 1, None):
+                workspace_folder = WorkspaceFolder.model_construct(
+                    name=create_pathname(name),
+                    folders={workspace_folder.name: workspace_folder},
+                )
 
         # Initialize folder logic
         # Check if this top-level folder already exists
@@ -133,8 +148,30 @@ class Workspace(WorkspaceBaseModel):
 
         self.save()
 
-        # Return the deepest nested path
-        return self._get_deepest_folder(workspace_folder)
+        # Return the deepest nested path, the chain above `leaf` was built here
+        # so only folders passed in through kwargs are left to descend.
+        return self._get_deepest_folder(leaf)
+
+    @contextmanager
+    def deferred_save(self) -> Iterator["Workspace"]:
+        """
+        Defer saves to the default config file until the block exits.
+        Useful when creating several folders, each of which would otherwise
+        rewrite the entire config.
+        """
+        if self._defer_save:
+            # Nested block, the outermost one writes the config.
+            yield self
+            return
+
+        self._defer_save = True
+        try:
+            yield self
+        finally:
+            # Still write on errors so folders created so far are recorded.
+            self._defer_save = False
+            if self._save_pending:
+                self.save()
 
     def save(self, path: Path | None = None) -> Path:
         """
@@ -144,14 +181,49 @@ class Workspace(WorkspaceBaseModel):
         if path is None:
             path = self.path / self.config_file
 
+            if self._defer_save:
+                self._save_pending = True
+                return path
+
+            # Only a write to the default config satisfies a deferred save.
+            self._save_pending = False
+
         path.parent.mkdir(parents=True, exist_ok=True)
-        _ = path.write_text(self.model_dump_json(indent=2))
+
+        # Write to a temporary file and swap it in with a single rename so an
+        # interrupted save never leaves a partially written config behind.
+        # The temporary file is unique so concurrent saves don't collide.
+        fd, tmp_name = tempfile.mkstemp(
+            dir=path.parent, prefix=path.name, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                _ = f.write(self.model_dump_json(indent=2).encode("utf-8"))
+
+            # `mkstemp` creates the file as 0600, keep the existing config's mode
+            # or use the default a plain file write would give.
+            try:
+                mode = stat.S_IMODE(os.stat(path).st_mode)
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+            os.chmod(tmp_name, mode)
+
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except FileNotFoundError:
+                pass
+            raise
 
         return path
 
     @classmethod
     def load(cls: type["Workspace"], path: Path) -> "Workspace":
-        if not path.exists():
+        try:
+            # Validating from bytes lets pydantic skip decoding to `str`.
+            data = path.read_bytes()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Workspace file not found at {path}")
 
-        return cls.model_validate_json(path.read_text())
+        return cls.model_validate_json(data)
@@ -28,14 +28,19 @@ class WorkspaceBaseModel(BaseModel):
             return v
 
         if isinstance(v, list):
+            # Keys use the sanitized name so they match `WorkspaceFolder.name`.
             result = {}
             for folder in v:
                 if isinstance(folder, WorkspaceFolder):
                     result[folder.name] = folder
                 elif isinstance(folder, dict):
-                    result[folder["name"]] = folder
+                    result[create_pathname(folder["name"])] = folder
                 elif isinstance(folder, str):
-                    result[folder] = WorkspaceFolder(name=folder)
+                    # Only a name is given, so skip validating the other fields.
+                    name = create_pathname(folder)
+                    result[name] = WorkspaceFolder.model_construct(
+                        name=name, path=Path(""), folders={}, files=[]
+                    )
             return result
 
         else:
@@ -7,7 +7,11 @@ class WorkspaceFolder(WorkspaceBaseModel):
     """
 
     def initialize(self, force: bool = False):
-        self.path.mkdir(exist_ok=force)
-        for name, folder in self.folders.items():
-            folder.path = self.path / name
-            folder.initialize(force=force)
+        # Parents are created before their nested folders are pushed.
+        stack = [self]
+        while stack:
+            folder = stack.pop()
+            folder.path.mkdir(exist_ok=force)
+            for name, nested in folder.folders.items():
+                nested.path = folder.path / name
+                stack.append(nested)
@@ -1,3 +1,6 @@
+import os
+
+from itertools import islice
 from pathlib import Path
 
 from wa.utils import get_project_root
@@ -5,6 +8,16 @@ from wa.workspace.models.workspace import Workspace
 from wa.workspace.models.workspace_folder import WorkspaceFolder
 
 
+def _list_files(path: Path) -> list[str]:
+    """
+    Lists names of files directly inside path.
+    """
+    # `DirEntry.is_file()` reuses the type from the directory listing instead
+    # of issuing a `stat()` per entry like `Path.is_file()`.
+    with os.scandir(path) as entries:
+        return [entry.name for entry in entries if entry.is_file()]
+
+
 def include_files_recursive(
     folders: dict[str, WorkspaceFolder], parent_path: Path
 ) -> None:
@@ -14,8 +27,10 @@ def include_files_recursive(
     for name, folder in folders.items():
         folder_path = parent_path / name
         folder.path = folder_path
-        if folder_path.exists():
-            folder.files = [f.name for f in folder_path.iterdir() if f.is_file()]
+        try:
+            folder.files = _list_files(folder_path)
+        except FileNotFoundError:
+            pass
         if folder.folders:
             include_files_recursive(folder.folders, folder_path)
 
@@ -33,27 +48,29 @@ def read_workspace(
     if workspaces_path is None:
         workspaces_path = get_project_root() / "workspaces"
 
-    if not workspaces_path.exists():
-        raise FileNotFoundError("Workspaces folder does not exist.")
-
     workspace_path = workspaces_path / workspace_name
+    workspace_file = workspace_path / "workspace.json"
 
-    if not workspace_path.exists():
-        raise FileNotFoundError(f"Workspace folder: `{workspace_name}` does not exist.")
+    try:
+        workspace = Workspace.load(workspace_file)
+    except FileNotFoundError:
+        # Only check which part of the path is missing once loading has failed.
+        if not workspaces_path.exists():
+            raise FileNotFoundError("Workspaces folder does not exist.")
 
-    workspace_file = workspace_path / "workspace.json"
+        if not workspace_path.exists():
+            raise FileNotFoundError(
+                f"Workspace folder: `{workspace_name}` does not exist."
+            )
 
-    if not workspace_file.exists():
         raise FileNotFoundError(
             f"Config file (`workspace.json`) for workspace `{workspace_name}` does not exist."
         )
 
-    workspace = Workspace.load(workspace_file)
-
     # Populate files recursively if requested
     if include_files:
         include_files_recursive(workspace.folders, workspace.path)
-        workspace.files = [f.name for f in workspace.path.iterdir() if f.is_file()]
+        workspace.files = _list_files(workspace.path)
 
     return workspace
 
@@ -74,12 +91,13 @@ def read_workspace_folder(
     )
 
     if isinstance(workspace_folder_name, str):
-        if workspace_folder_name not in workspace.folders.keys():
+        try:
+            folder = workspace.folders[workspace_folder_name]
+        except KeyError:
             raise Exception(
                 f"Workspace subfolder `{workspace_folder_name}` not found in workspace."
             )
 
-        folder = workspace.folders[workspace_folder_name]
         folder.path = workspace.path / workspace_folder_name
 
     elif isinstance(workspace_folder_name, list):
@@ -87,29 +105,31 @@ def read_workspace_folder(
         if len(workspace_folder_name) < 1:
             raise Exception("No folder names provided.")
 
-        folder_names = workspace_folder_name.copy()
-
-        if workspace_folder_name[0] not in workspace.folders:
+        try:
+            folder = workspace.folders[workspace_folder_name[0]]
+        except KeyError:
             raise FileNotFoundError(
                 f"Workspace subfolder `{workspace_folder_name[0]}` not found in workspace."
             )
 
-        current_path = workspace.path
-        for index, folder_name in enumerate(folder_names):
-            if index == 0:
-                folder = workspace.folders[folder_name]
-            else:
-                if folder_name not in folder.folders.keys():
-                    raise FileNotFoundError(
-                        f"Workspace folder `{folder_names[-1]}` not found in workspace, missing `{folder_name}`."
-                    )
+        current_path = workspace.path / workspace_folder_name[0]
+        for folder_name in islice(workspace_folder_name, 1, None):
+            try:
                 folder = folder.folders[folder_name]
+            except KeyError:
+                raise FileNotFoundError(
+                    f"Workspace folder `{workspace_folder_name[-1]}` not found in workspace, missing `{folder_name}`."
+                )
             current_path = current_path / folder_name
         folder.path = current_path
 
     # Populate files if requested
-    if include_files and folder.path.exists():
-        include_files_recursive(folder.folders, folder.path)
-        folder.files = [f.name for f in folder.path.iterdir() if f.is_file()]
+    if include_files:
+        try:
+            folder.files = _list_files(folder.path)
+        except FileNotFoundError:
+            pass
+        else:
+            include_files_recursive(folder.folders, folder.path)
 
     return folder
@@ -1,135 +1,79 @@
 from __future__ import annotations
 
 import sys
-from unittest.mock import MagicMock, patch, call
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 import typer
+from typer.testing import CliRunner
 
+from wa.cli import app as cli_app
 from wa.cli.__main__ import app, _rich_exception_handler
 
 
+class CustomError(Exception):
+    pass
+
+
+@pytest.fixture
+def handler_mocks(monkeypatch):
+    """Replace the side effects of `_rich_exception_handler` with mocks."""
+    mocks = SimpleNamespace(
+        rprint=MagicMock(), exit=MagicMock(), excepthook=MagicMock()
+    )
+    monkeypatch.setattr("wa.cli.__main__.rprint", mocks.rprint)
+    monkeypatch.setattr(sys, "exit", mocks.exit)
+    monkeypatch.setattr(sys, "__excepthook__", mocks.excepthook)
+    return mocks
+
+
 class TestRichExceptionHandler:
     """Test the _rich_exception_handler function."""
 
-    @patch("wa.cli.__main__.rprint")
-    @patch("sys.exit")
-    def test_keyboard_interrupt_handling(self, mock_exit, mock_rprint):
+    def test_keyboard_interrupt_handling(self, handler_mocks):
         """Test that KeyboardInterrupt is handled with custom message."""
-        # Create a mock traceback
-        mock_traceback = MagicMock()
-
-        # Call the exception handler with KeyboardInterrupt
-        _rich_exception_handler(KeyboardInterrupt, KeyboardInterrupt(), mock_traceback)
+        _rich_exception_handler(KeyboardInterrupt, KeyboardInterrupt(), MagicMock())
 
-        # Should print the cancellation message
-        mock_rprint.assert_called_once_with(
+        # Should print the cancellation message and exit with code 1 (error)
+        handler_mocks.rprint.assert_called_once_with(
             "\n ⚠️  [yellow]Operation cancelled by user[/yellow]"
         )
-
-        # Should call sys.exit(1)
-        mock_exit.assert_called_once_with(1)
-
-    @patch("sys.__excepthook__")
-    def test_other_exceptions_delegated(self, mock_excepthook):
-        """Test that non-KeyboardInterrupt exceptions are delegated to default handler."""
-        # Create a test exception
-        exc_type = ValueError
-        exc_value = ValueError("Test error")
-        mock_traceback = MagicMock()
-
-        # Call the exception handler with ValueError
-        _rich_exception_handler(exc_type, exc_value, mock_traceback)
-
-        # Should delegate to sys.__excepthook__
-        mock_excepthook.assert_called_once_with(exc_type, exc_value, mock_traceback)
-
-    @patch("sys.__excepthook__")
-    def test_runtime_error_delegated(self, mock_excepthook):
-        """Test that RuntimeError is delegated to default handler."""
-        exc_type = RuntimeError
-        exc_value = RuntimeError("Runtime error")
-        mock_traceback = MagicMock()
-
-        _rich_exception_handler(exc_type, exc_value, mock_traceback)
-
-        mock_excepthook.assert_called_once_with(exc_type, exc_value, mock_traceback)
-
-    @patch("sys.__excepthook__")
-    def test_custom_exception_delegated(self, mock_excepthook):
-        """Test that custom exceptions are delegated to default handler."""
-
-        class CustomError(Exception):
-            pass
-
-        exc_type = CustomError
-        exc_value = CustomError("Custom error")
-        mock_traceback = MagicMock()
-
-        _rich_exception_handler(exc_type, exc_value, mock_traceback)
-
-        mock_excepthook.assert_called_once_with(exc_type, exc_value, mock_traceback)
-
-    @patch("wa.cli.__main__.rprint")
-    @patch("sys.exit")
-    @patch("sys.__excepthook__")
-    def test_keyboard_interrupt_does_not_call_default_handler(
-        self, mock_excepthook, mock_exit, mock_rprint
-    ):
-        """Test that KeyboardInterrupt doesn't call the default exception handler."""
-        mock_traceback = MagicMock()
-
-        _rich_exception_handler(KeyboardInterrupt, KeyboardInterrupt(), mock_traceback)
+        handler_mocks.exit.assert_called_once_with(1)
 
         # Should NOT call sys.__excepthook__
-        mock_excepthook.assert_not_called()
+        handler_mocks.excepthook.assert_not_called()
 
-    @patch("wa.cli.__main__.rprint")
-    @patch("sys.exit")
-    def test_keyboard_interrupt_message_format(self, mock_exit, mock_rprint):
+    def test_keyboard_interrupt_message_format(self, handler_mocks):
         """Test the exact format of the KeyboardInterrupt message."""
-        mock_traceback = MagicMock()
-
-        _rich_exception_handler(KeyboardInterrupt, KeyboardInterrupt(), mock_traceback)
+        _rich_exception_handler(KeyboardInterrupt, KeyboardInterrupt(), MagicMock())
 
-        # Verify the exact message format
-        call_args = mock_rprint.call_args[0][0]
+        call_args = handler_mocks.rprint.call_args[0][0]
         assert "⚠️" in call_args
         assert "yellow" in call_args
         assert "Operation cancelled by user" in call_args
         assert call_args.startswith("\n")
 
-    @patch("wa.cli.__main__.rprint")
-    @patch("sys.exit")
-    def test_keyboard_interrupt_exits_with_code_1(self, mock_exit, mock_rprint):
-        """Test that KeyboardInterrupt exits with code 1."""
-        mock_traceback = MagicMock()
-
-        _rich_exception_handler(KeyboardInterrupt, KeyboardInterrupt(), mock_traceback)
-
-        # Should exit with code 1 (error)
-        mock_exit.assert_called_once_with(1)
-
-    @patch("sys.__excepthook__")
-    def test_exception_with_none_traceback(self, mock_excepthook):
-        """Test handling exception with None traceback."""
-        exc_type = ValueError
-        exc_value = ValueError("Error")
-
-        _rich_exception_handler(exc_type, exc_value, None)
-
-        mock_excepthook.assert_called_once_with(exc_type, exc_value, None)
-
-    @patch("sys.__excepthook__")
-    def test_system_exit_delegated(self, mock_excepthook):
-        """Test that SystemExit is delegated to default handler."""
-        exc_type = SystemExit
-        exc_value = SystemExit(0)
-        mock_traceback = MagicMock()
+    @pytest.mark.parametrize(
+        "exc_value, traceback",
+        [
+            (ValueError("Test error"), MagicMock()),
+            (RuntimeError("Runtime error"), MagicMock()),
+            (CustomError("Custom error"), MagicMock()),
+            (SystemExit(0), MagicMock()),
+            (ValueError("Error"), None),
+        ],
+        ids=["value_error", "runtime_error", "custom", "system_exit", "no_traceback"],
+    )
+    def test_other_exceptions_delegated(self, handler_mocks, exc_value, traceback):
+        """Test that non-KeyboardInterrupt exceptions are delegated to default handler."""
+        exc_type = type(exc_value)
 
-        _rich_exception_handler(exc_type, exc_value, mock_traceback)
+        _rich_exception_handler(exc_type, exc_value, traceback)
 
-        mock_excepthook.assert_called_once_with(exc_type, exc_value, mock_traceback)
+        handler_mocks.excepthook.assert_called_once_with(exc_type, exc_value, traceback)
+        handler_mocks.rprint.assert_not_called()
+        handler_mocks.exit.assert_not_called()
 
 
 class TestAppConfiguration:
@@ -175,9 +119,7 @@ class TestExceptionHookInstallation:
         # Note: This test might be fragile if other code modifies excepthook
         assert sys.excepthook == _rich_exception_handler
 
-    @patch("wa.cli.__main__.rprint")
-    @patch("sys.exit")
-    def test_exception_hook_can_be_triggered(self, mock_exit, mock_rprint):
+    def test_exception_hook_can_be_triggered(self, handler_mocks):
         """Test that the installed exception hook can be triggered."""
         # Save original excepthook
         original_hook = sys.excepthook
@@ -194,9 +136,34 @@ class TestExceptionHookInstallation:
                 sys.excepthook(exc_type, exc_value, exc_traceback)
 
             # Should have printed message and called exit
-            mock_rprint.assert_called_once()
-            mock_exit.assert_called_once_with(1)
+            handler_mocks.rprint.assert_called_once()
+            handler_mocks.exit.assert_called_once_with(1)
 
         finally:
             # Restore original excepthook
             sys.excepthook = original_hook
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """Shared CLI runner, it holds no state between invocations."""
+    return CliRunner()
+
+
+class TestLazyTyperGroup:
+    """Test lazy registration of sub-apps on the main app."""
+
+    def test_lazy_subcommand_listed_in_help(self, runner):
+        """Test that lazily registered sub-apps appear in the main help."""
+        result = runner.invoke(cli_app, ["--help"])
+
+        assert result.exit_code == 0
+        assert "mcp" in result.output
+
+    def test_lazy_subcommand_resolves_sub_app(self, runner):
+        """Test that lazily registered sub-apps resolve to their commands."""
+        result = runner.invoke(cli_app, ["mcp", "--help"])
+
+        assert result.exit_code == 0
+        assert "install" in result.output
+        assert "uninstall" in result.output
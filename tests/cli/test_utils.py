@@ -6,7 +6,8 @@ from unittest.mock import MagicMock, patch
 import pytest
 import typer
 
-from wa.cli.utils import get_workspace_path, print_list
+from wa.cli.utils import get_workspace, get_workspace_path, print_list
+from wa.workspace.models.workspace import Workspace
 
 
 class TestPrintList:
@@ -18,40 +19,40 @@ class TestPrintList:
         values = ["item1", "item2", "item3"]
         print_list("Test Items", values)
 
-        # Should call rprint 4 times: header + 3 items
-        assert mock_rprint.call_count == 4
-        mock_rprint.assert_any_call("\n  Test Items:")
-        mock_rprint.assert_any_call("  1. [cyan]item1[/cyan]")
-        mock_rprint.assert_any_call("  2. [cyan]item2[/cyan]")
-        mock_rprint.assert_any_call("  3. [cyan]item3[/cyan]")
+        # Should call rprint once with header + 3 items
+        mock_rprint.assert_called_once_with(
+            "\n  Test Items:\n"
+            "  1. [cyan]item1[/cyan]\n"
+            "  2. [cyan]item2[/cyan]\n"
+            "  3. [cyan]item3[/cyan]"
+        )
 
     @patch("wa.cli.utils.rprint")
     def test_print_list_with_empty_list(self, mock_rprint):
         """Test that print_list handles empty list correctly."""
         print_list("Empty Items", [])
 
-        # Should call rprint 1 time for header only (no items to display)
-        assert mock_rprint.call_count == 1
-        mock_rprint.assert_any_call("\n  Empty Items:")
+        # Should print the header only (no items to display)
+        mock_rprint.assert_called_once_with("\n  Empty Items:")
 
     @patch("wa.cli.utils.rprint")
     def test_print_list_with_none(self, mock_rprint):
         """Test that print_list handles None correctly."""
         print_list("Missing Items", None)
 
-        # Should call rprint 2 times: header + warning message
-        assert mock_rprint.call_count == 2
-        mock_rprint.assert_any_call("\n  Missing Items:")
-        mock_rprint.assert_any_call("  ⚠️  [yellow]No Missing Items found.[/yellow]")
+        # Should print header + warning message
+        mock_rprint.assert_called_once_with(
+            "\n  Missing Items:\n  ⚠️  [yellow]No Missing Items found.[/yellow]"
+        )
 
     @patch("wa.cli.utils.rprint")
     def test_print_list_with_single_item(self, mock_rprint):
         """Test that print_list handles single item correctly."""
         print_list("Single Item", ["only_one"])
 
-        assert mock_rprint.call_count == 2
-        mock_rprint.assert_any_call("\n  Single Item:")
-        mock_rprint.assert_any_call("  1. [cyan]only_one[/cyan]")
+        mock_rprint.assert_called_once_with(
+            "\n  Single Item:\n  1. [cyan]only_one[/cyan]"
+        )
 
     @patch("wa.cli.utils.rprint")
     def test_print_list_indexing_starts_at_one(self, mock_rprint):
@@ -60,8 +61,8 @@ class TestPrintList:
         print_list("Items", values)
 
         # Check that indices are 1-based
-        mock_rprint.assert_any_call("  1. [cyan]first[/cyan]")
-        mock_rprint.assert_any_call("  2. [cyan]second[/cyan]")
+        lines = mock_rprint.call_args[0][0].splitlines()
+        assert lines[-2:] == ["  1. [cyan]first[/cyan]", "  2. [cyan]second[/cyan]"]
 
 
 class TestGetWorkspacePath:
@@ -176,3 +177,33 @@ class TestGetWorkspacePath:
 
         result = get_workspace_path(workspace=None)
         assert isinstance(result, Path)
+
+
+class TestGetWorkspace:
+    """Test the get_workspace function."""
+
+    def test_get_workspace_loads_config(self, tmp_path):
+        """Test that get_workspace loads the workspace config."""
+        workspace = Workspace(
+            name="my_workspace",
+            workspaces_path=tmp_path / "workspaces",
+        )
+        workspace.save()
+
+        with patch("wa.cli.utils.get_project_root", return_value=tmp_path):
+            result = get_workspace(workspace="my_workspace")
+
+        assert isinstance(result, Workspace)
+        assert result.name == "my_workspace"
+
+    @patch("wa.cli.utils.rprint")
+    def test_get_workspace_missing_config_raises_error(self, mock_rprint, tmp_path):
+        """Test that get_workspace exits when the config file doesn't exist."""
+        (tmp_path / "workspaces" / "no_config").mkdir(parents=True)
+
+        with patch("wa.cli.utils.get_project_root", return_value=tmp_path):
+            with pytest.raises(typer.Exit) as exc_info:
+                get_workspace(workspace="no_config")
+
+        assert exc_info.value.exit_code == 1
+        assert "not a valid workspace folder" in mock_rprint.call_args[0][0]
@@ -0,0 +1,32 @@
+import subprocess
+from unittest.mock import MagicMock
+
+import pytest
+
+# Probe for the optional `mcp[cli]` extra once for all MCP test modules.
+try:
+    import mcp.cli  # noqa: F401
+
+    MCP_CLI_AVAILABLE = True
+except ImportError:
+    MCP_CLI_AVAILABLE = False
+
+skip_if_no_mcp_cli = pytest.mark.skipif(
+    not MCP_CLI_AVAILABLE, reason="mcp.cli module not available"
+)
+
+
+@pytest.fixture(autouse=True)
+def mock_run(monkeypatch):
+    """Stub `subprocess.run` so no test here launches a client or `npx`."""
+    run = MagicMock(return_value=MagicMock(returncode=0))
+    # `wa.mcp` modules call it as `subprocess.run`, one patch covers them all.
+    monkeypatch.setattr(subprocess, "run", run)
+    return run
+
+
+def printed(mock_rprint: MagicMock, text: str) -> bool:
+    """Return whether any message passed to `mock_rprint` contains `text`."""
+    return any(
+        text in str(arg) for call in mock_rprint.call_args_list for arg in call.args
+    )
@@ -11,36 +11,44 @@ from wa.mcp.types import ToolError, ToolSuccess, T
 class TestToolError:
     """Test the ToolError Pydantic model."""
 
-    def test_tool_error_basic_creation(self):
-        """Test creating a basic ToolError."""
-        error = ToolError(error="Something went wrong", error_code="ERR_001")
+    @pytest.mark.parametrize(
+        "kwargs, expected_details",
+        [
+            pytest.param(
+                {"error": "Something went wrong", "error_code": "ERR_001"},
+                {},
+                id="default_details",
+            ),
+            pytest.param(
+                {
+                    "error": "File not found",
+                    "error_code": "ERR_FILE_NOT_FOUND",
+                    "details": {"path": "/some/path", "line": 42},
+                },
+                {"path": "/some/path", "line": 42},
+                id="details",
+            ),
+            pytest.param(
+                {
+                    "error": "Complex error",
+                    "error_code": "COMPLEX",
+                    "details": {
+                        "nested": {"level1": {"level2": "value"}},
+                        "list": [1, 2, 3],
+                    },
+                },
+                {"nested": {"level1": {"level2": "value"}}, "list": [1, 2, 3]},
+                id="nested_details",
+            ),
+        ],
+    )
+    def test_tool_error_creation(self, kwargs, expected_details):
+        """Test creating ToolError, success is always False."""
+        error = ToolError(**kwargs)
         assert error.success is False
-        assert error.error == "Something went wrong"
-        assert error.error_code == "ERR_001"
-        assert error.details == {}
-
-    def test_tool_error_with_details(self):
-        """Test creating ToolError with additional details."""
-        error = ToolError(
-            error="File not found",
-            error_code="ERR_FILE_NOT_FOUND",
-            details={"path": "/some/path", "line": 42},
-        )
-        assert error.success is False
-        assert error.error == "File not found"
-        assert error.error_code == "ERR_FILE_NOT_FOUND"
-        assert error.details == {"path": "/some/path", "line": 42}
-
-    def test_tool_error_success_always_false(self):
-        """Test that success field is always False for ToolError."""
-        error = ToolError(error="Error", error_code="ERR")
-        assert error.success is False
-
-    def test_tool_error_empty_details_default(self):
-        """Test that details defaults to empty dict."""
-        error = ToolError(error="Error", error_code="ERR")
-        assert error.details == {}
-        assert isinstance(error.details, dict)
+        assert error.error == kwargs["error"]
+        assert error.error_code == kwargs["error_code"]
+        assert error.details == expected_details
 
     def test_tool_error_serialization(self):
         """Test ToolError serialization to dict."""
@@ -66,70 +74,61 @@ class TestToolError:
         assert "Test error" in json_str
         assert "TEST" in json_str
 
-    def test_tool_error_required_fields(self):
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({}, id="no_fields"),
+            pytest.param({"error_code": "ERR"}, id="missing_error"),
+            pytest.param({"error": "Error message"}, id="missing_error_code"),
+        ],
+    )
+    def test_tool_error_required_fields(self, kwargs):
         """Test that error and error_code are required."""
         with pytest.raises(ValidationError):
-            ToolError()  # Missing required fields
-
-    def test_tool_error_missing_error_field(self):
-        """Test that error field is required."""
-        with pytest.raises(ValidationError):
-            ToolError(error_code="ERR")  # Missing error
-
-    def test_tool_error_missing_error_code_field(self):
-        """Test that error_code field is required."""
-        with pytest.raises(ValidationError):
-            ToolError(error="Error message")  # Missing error_code
-
-    def test_tool_error_details_can_be_nested(self):
-        """Test that details can contain nested structures."""
-        error = ToolError(
-            error="Complex error",
-            error_code="COMPLEX",
-            details={"nested": {"level1": {"level2": "value"}}, "list": [1, 2, 3]},
-        )
-        assert error.details["nested"]["level1"]["level2"] == "value"
-        assert error.details["list"] == [1, 2, 3]
+            ToolError(**kwargs)
 
 
 class TestToolSuccess:
     """Test the ToolSuccess Pydantic model."""
 
-    def test_tool_success_basic_creation_string(self):
-        """Test creating ToolSuccess with string data."""
-        success = ToolSuccess[str](data="Operation completed")
-        assert success.success is True
-        assert success.data == "Operation completed"
-
-    def test_tool_success_basic_creation_dict(self):
-        """Test creating ToolSuccess with dict data."""
-        data = {"result": "OK", "count": 42}
-        success = ToolSuccess[dict](data=data)
-        assert success.success is True
-        assert success.data == data
-
-    def test_tool_success_basic_creation_list(self):
-        """Test creating ToolSuccess with list data."""
-        data = ["item1", "item2", "item3"]
-        success = ToolSuccess[list](data=data)
+    @pytest.mark.parametrize(
+        "data_type, data",
+        [
+            pytest.param(str, "Operation completed", id="str"),
+            pytest.param(dict, {"result": "OK", "count": 42}, id="dict"),
+            pytest.param(list, ["item1", "item2", "item3"], id="list"),
+            pytest.param(int, 12345, id="int"),
+            pytest.param(bool, True, id="bool"),
+            pytest.param(None, None, id="none"),
+            pytest.param(
+                dict,
+                {"value": "test", "nested": {"level1": {"level2": "deep"}}},
+                id="nested_dict",
+            ),
+        ],
+    )
+    def test_tool_success_creation(self, data_type, data):
+        """Test creating ToolSuccess, success is always True."""
+        success = ToolSuccess[data_type](data=data)
         assert success.success is True
         assert success.data == data
-
-    def test_tool_success_success_always_true(self):
-        """Test that success field is always True for ToolSuccess."""
-        success = ToolSuccess[str](data="test")
-        assert success.success is True
-
-    def test_tool_success_serialization_string(self):
-        """Test ToolSuccess serialization with string data."""
-        success = ToolSuccess[str](data="hello")
-        serialized = success.model_dump()
-        assert serialized == {"success": True, "data": "hello"}
-
-    def test_tool_success_serialization_complex_data(self):
-        """Test ToolSuccess serialization with complex data."""
-        data = {"workspace": "test", "folders": ["a", "b"], "created": True}
-        success = ToolSuccess[dict](data=data)
+        # Generic type information is preserved
+        assert type(success.data) is type(data)
+
+    @pytest.mark.parametrize(
+        "data_type, data",
+        [
+            pytest.param(str, "hello", id="str"),
+            pytest.param(
+                dict,
+                {"workspace": "test", "folders": ["a", "b"], "created": True},
+                id="dict",
+            ),
+        ],
+    )
+    def test_tool_success_serialization(self, data_type, data):
+        """Test ToolSuccess serialization to dict."""
+        success = ToolSuccess[data_type](data=data)
         serialized = success.model_dump()
         assert serialized == {"success": True, "data": data}
 
@@ -146,40 +145,6 @@ class TestToolSuccess:
         with pytest.raises(ValidationError):
             ToolSuccess[str]()  # Missing data
 
-    def test_tool_success_with_none_data(self):
-        """Test ToolSuccess with None as data."""
-        success = ToolSuccess[None](data=None)
-        assert success.success is True
-        assert success.data is None
-
-    def test_tool_success_with_integer_data(self):
-        """Test ToolSuccess with integer data."""
-        success = ToolSuccess[int](data=12345)
-        assert success.success is True
-        assert success.data == 12345
-
-    def test_tool_success_with_boolean_data(self):
-        """Test ToolSuccess with boolean data."""
-        success = ToolSuccess[bool](data=True)
-        assert success.success is True
-        assert success.data is True
-
-    def test_tool_success_generic_type_preserved(self):
-        """Test that generic type information is preserved."""
-        success_str = ToolSuccess[str](data="text")
-        success_int = ToolSuccess[int](data=42)
-
-        assert isinstance(success_str.data, str)
-        assert isinstance(success_int.data, int)
-
-    def test_tool_success_with_nested_dict(self):
-        """Test ToolSuccess with nested dict structure."""
-        custom_data = {"value": "test", "nested": {"level1": {"level2": "deep"}}}
-        success = ToolSuccess[dict](data=custom_data)
-        assert success.success is True
-        assert success.data["value"] == "test"
-        assert success.data["nested"]["level1"]["level2"] == "deep"
-
 
 class TestToolResponse:
     """Test the ToolResponse type alias."""
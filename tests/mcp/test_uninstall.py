@@ -1,49 +1,41 @@
 from __future__ import annotations
 
 import subprocess
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
-from wa.mcp.uninstall import uninstall
-
-
-class TestUninstall:
-    """Test the MCP uninstall function."""
+import pytest
 
-    @patch("wa.mcp.uninstall.subprocess.run")
-    def test_uninstall_claude_code(self, mock_run):
-        """Test uninstalling for Claude Code client."""
-        mock_run.return_value = MagicMock(returncode=0)
+from wa.mcp.uninstall import uninstall
 
-        uninstall(client="claude-code")
+from .conftest import printed
 
-        mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
-        assert args == ["claude", "mcp", "remove", "workspace"]
+# Command each client's 'workspace' server is removed with.
+CLIENT_EXPECTATIONS = {
+    "claude-code": ["claude", "mcp", "remove", "workspace"],
+    "gemini-cli": ["gemini", "mcp", "remove", "workspace"],
+    "codex": ["codex", "mcp", "remove", "workspace"],
+}
 
-    @patch("wa.mcp.uninstall.subprocess.run")
-    def test_uninstall_gemini_cli(self, mock_run):
-        """Test uninstalling for Gemini CLI client."""
-        mock_run.return_value = MagicMock(returncode=0)
 
-        uninstall(client="gemini-cli")
+@pytest.fixture
+def mock_rprint(monkeypatch):
+    """Capture the messages `uninstall` prints."""
+    rprint = MagicMock()
+    monkeypatch.setattr("wa.mcp.uninstall.rprint", rprint)
+    return rprint
 
-        mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
-        assert args == ["gemini", "mcp", "remove", "workspace"]
 
-    @patch("wa.mcp.uninstall.subprocess.run")
-    def test_uninstall_codex(self, mock_run):
-        """Test uninstalling for Codex client."""
-        mock_run.return_value = MagicMock(returncode=0)
+class TestUninstall:
+    """Test the MCP uninstall function."""
 
-        uninstall(client="codex")
+    @pytest.mark.parametrize("client, expected", CLIENT_EXPECTATIONS.items())
+    def test_uninstall_client(self, mock_run, client, expected):
+        """Test that each client removes the 'workspace' server."""
+        uninstall(client=client)
 
         mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
-        assert args == ["codex", "mcp", "remove", "workspace"]
+        assert mock_run.call_args[0][0] == expected
 
-    @patch("wa.mcp.uninstall.subprocess.run")
-    @patch("wa.mcp.uninstall.rprint")
     def test_uninstall_with_invalid_client(self, mock_rprint, mock_run):
         """Test uninstalling with an invalid client name."""
         uninstall(client="invalid")
@@ -53,11 +45,8 @@ class TestUninstall:
 
         # Verify that rprint was called with warning message
         mock_rprint.assert_called_once()
-        call_args = str(mock_rprint.call_args[0][0])
-        assert "No client provided" in call_args
+        assert printed(mock_rprint, "No client provided")
 
-    @patch("wa.mcp.uninstall.subprocess.run")
-    @patch("wa.mcp.uninstall.rprint")
     def test_uninstall_handles_subprocess_error(self, mock_rprint, mock_run):
         """Test that uninstall handles subprocess errors gracefully."""
         mock_run.side_effect = subprocess.CalledProcessError(1, ["cmd"])
@@ -65,14 +54,8 @@ class TestUninstall:
         uninstall(client="claude-code")
 
         # Verify error message was printed
-        mock_rprint.assert_called()
-        call_args = " ".join(
-            [str(arg) for call in mock_rprint.call_args_list for arg in call[0]]
-        )
-        assert "failed" in call_args.lower()
-
-    @patch("wa.mcp.uninstall.subprocess.run")
-    @patch("wa.mcp.uninstall.rprint")
+        assert printed(mock_rprint, "failed")
+
     def test_uninstall_handles_subprocess_error_with_stderr(
         self, mock_rprint, mock_run
     ):
@@ -84,14 +67,8 @@ class TestUninstall:
         uninstall(client="claude-code")
 
         # Verify error message was printed with stderr
-        mock_rprint.assert_called()
-        call_args = " ".join(
-            [str(arg) for call in mock_rprint.call_args_list for arg in call[0]]
-        )
-        assert "Error output" in call_args or "failed" in call_args.lower()
-
-    @patch("wa.mcp.uninstall.subprocess.run")
-    @patch("wa.mcp.uninstall.rprint")
+        assert printed(mock_rprint, "Error output: Error details")
+
     def test_uninstall_handles_unexpected_error(self, mock_rprint, mock_run):
         """Test that uninstall handles unexpected errors gracefully."""
         mock_run.side_effect = Exception("Unexpected error")
@@ -99,45 +76,15 @@ class TestUninstall:
         uninstall(client="claude-code")
 
         # Verify error message was printed
-        mock_rprint.assert_called()
-        call_args = " ".join(
-            [str(arg) for call in mock_rprint.call_args_list for arg in call[0]]
-        )
-        assert "Unexpected error" in call_args
-
-    @patch("wa.mcp.uninstall.subprocess.run")
-    @patch("wa.mcp.uninstall.rprint")
+        assert printed(mock_rprint, "Unexpected error")
+
     def test_uninstall_prints_command_before_running(self, mock_rprint, mock_run):
         """Test that uninstall prints the command before executing it."""
-        mock_run.return_value = MagicMock(returncode=0)
-
         uninstall(client="claude-code")
 
         # Verify command was printed
-        mock_rprint.assert_called()
-        call_args = " ".join(
-            [str(arg) for call in mock_rprint.call_args_list for arg in call[0]]
-        )
-        assert (
-            "Running command" in call_args or "claude mcp remove workspace" in call_args
-        )
-
-    @patch("wa.mcp.uninstall.subprocess.run")
-    def test_uninstall_uses_correct_server_name(self, mock_run):
-        """Test that all clients use 'workspace' as the server name."""
-        mock_run.return_value = MagicMock(returncode=0)
-
-        clients = ["claude-code", "gemini-cli", "codex"]
-
-        for client in clients:
-            mock_run.reset_mock()
-            uninstall(client=client)
-
-            args = mock_run.call_args[0][0]
-            # Verify 'workspace' is the server name (last argument)
-            assert args[-1] == "workspace"
-
-    @patch("wa.mcp.uninstall.subprocess.run")
+        assert printed(mock_rprint, "claude mcp remove workspace")
+
     def test_uninstall_with_empty_client(self, mock_run):
         """Test uninstalling with an empty client string."""
         uninstall(client="")
@@ -145,11 +92,8 @@ class TestUninstall:
         # Verify that subprocess was not called
         mock_run.assert_not_called()
 
-    @patch("wa.mcp.uninstall.subprocess.run")
     def test_uninstall_runs_with_check_true(self, mock_run):
         """Test that uninstall runs subprocess with check=True."""
-        mock_run.return_value = MagicMock(returncode=0)
-
         uninstall(client="claude-code")
 
         # Verify subprocess.run was called with check=True
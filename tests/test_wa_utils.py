@@ -1,17 +1,32 @@
 from __future__ import annotations
 
+import base64
+
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 import importlib.util
+import re
 
 import pytest
 
-from wa.utils import get_project_root, create_pathname, append_timestamp_to_name_or_path
+from wa.utils import (
+    append_timestamp_to_name_or_path,
+    create_pathname,
+    get_project_root,
+    read_file_base64,
+)
 
 
 class TestGetProjectRoot:
     """Test the get_project_root function."""
 
+    @pytest.fixture(autouse=True)
+    def clear_project_root_cache(self):
+        """Prevent cached project roots from leaking between tests."""
+        get_project_root.cache_clear()
+        yield
+        get_project_root.cache_clear()
+
     def test_get_project_root_development_mode(self):
         """Test get_project_root in development mode (with src/ folder)."""
         # Mock spec to simulate development setup
@@ -84,6 +99,18 @@ class TestGetProjectRoot:
             result = get_project_root()
             assert isinstance(result, Path)
 
+    def test_get_project_root_is_cached(self):
+        """Test that get_project_root only resolves the package spec once."""
+        mock_spec = MagicMock()
+        mock_spec.origin = "/some/path/src/wa/__init__.py"
+
+        with patch("importlib.util.find_spec", return_value=mock_spec) as mock_find:
+            first = get_project_root()
+            second = get_project_root()
+
+        assert first == second
+        mock_find.assert_called_once()
+
 
 class TestCreatePathname:
     """Test the create_pathname function."""
@@ -159,6 +186,14 @@ class TestCreatePathname:
         result = create_pathname("file-name_v1.0(test)[final]{copy},ready;ok!@#$%^&+=")
         assert result == "file-name_v1.0(test)[final]{copy},ready;ok!@#$%^&+="
 
+    def test_create_pathname_returns_clean_name_unchanged(self):
+        """Test that names without characters to rewrite skip translation."""
+        name = "".join(["workspace", "_folder"])
+
+        # Bypass the cache, which may hold an equal string from another test.
+        # `str.translate` always builds a new string, so identity shows it was skipped
+        assert create_pathname.__wrapped__(name) is name
+
     def test_create_pathname_windows_forbidden_names(self):
         """Test create_pathname with Windows forbidden characters."""
         # All Windows forbidden characters
@@ -181,16 +216,14 @@ class TestAppendTimestampToNameOrPath:
 
         # Mock datetime to return a fixed time
         mock_datetime = MagicMock()
-        mock_datetime.now.return_value.strftime.return_value = (
-            "test_folder_20240315_143022"
-        )
+        mock_datetime.now.return_value.strftime.return_value = "_20240315_143022"
 
         with patch("wa.utils.datetime", mock_datetime):
             result = append_timestamp_to_name_or_path("test_folder")
             assert result == "test_folder_20240315_143022"
             # Verify strftime was called with correct format
             mock_datetime.now.return_value.strftime.assert_called_once_with(
-                "test_folder_%Y%m%d_%H%M%S"
+                "_%Y%m%d_%H%M%S"
             )
 
     def test_append_timestamp_to_name_list_input_single_element(self):
@@ -198,9 +231,7 @@ class TestAppendTimestampToNameOrPath:
         from datetime import datetime
 
         mock_datetime = MagicMock()
-        mock_datetime.now.return_value.strftime.return_value = (
-            "workspace_20240315_143022"
-        )
+        mock_datetime.now.return_value.strftime.return_value = "_20240315_143022"
 
         with patch("wa.utils.datetime", mock_datetime):
             result = append_timestamp_to_name_or_path(["workspace"])
@@ -212,9 +243,7 @@ class TestAppendTimestampToNameOrPath:
         from datetime import datetime
 
         mock_datetime = MagicMock()
-        mock_datetime.now.return_value.strftime.return_value = (
-            "subfolder_20240315_143022"
-        )
+        mock_datetime.now.return_value.strftime.return_value = "_20240315_143022"
 
         with patch("wa.utils.datetime", mock_datetime):
             result = append_timestamp_to_name_or_path(
@@ -236,7 +265,6 @@ class TestAppendTimestampToNameOrPath:
         with patch("wa.utils.datetime", mock_datetime):
             result = append_timestamp_to_name_or_path("")
             assert result == "_20240315_143022"
-            # Verify the format string starts with empty string
             mock_datetime.now.return_value.strftime.assert_called_once_with(
                 "_%Y%m%d_%H%M%S"
             )
@@ -306,10 +334,41 @@ class TestAppendTimestampToNameOrPath:
         from datetime import datetime
 
         mock_datetime = MagicMock()
-        mock_datetime.now.return_value.strftime.return_value = (
-            "my-folder_name_20240315_143022"
-        )
+        mock_datetime.now.return_value.strftime.return_value = "_20240315_143022"
 
         with patch("wa.utils.datetime", mock_datetime):
             result = append_timestamp_to_name_or_path("my-folder_name")
             assert result == "my-folder_name_20240315_143022"
+
+    def test_append_timestamp_to_name_with_percent_sign(self):
+        """Test that `%` in names is kept as is instead of parsed as a directive."""
+        result = append_timestamp_to_name_or_path("100%_done")
+        assert re.match(r"^100%_done_\d{8}_\d{6}$", result)
+
+    def test_append_timestamp_to_path_with_percent_sign(self):
+        """Test that `%` in the last Path component is kept as is."""
+        result = append_timestamp_to_name_or_path(Path("parent") / "%d")
+        assert result.parent == Path("parent")
+        assert re.match(r"^%d_\d{8}_\d{6}$", result.name)
+
+
+class TestReadFileBase64:
+    """Test the read_file_base64 function."""
+
+    @pytest.mark.parametrize("size", [0, 1, 2, 3, 57 * 1024, 57 * 1024 + 1, 200_000])
+    def test_read_file_base64_matches_b64encode(self, tmp_path, size):
+        """Test that chunked encoding matches encoding the whole file at once."""
+        data = bytes(i % 251 for i in range(size))
+        file_path = tmp_path / "data.bin"
+        file_path.write_bytes(data)
+
+        assert read_file_base64(file_path) == base64.b64encode(data).decode("ascii")
+
+    def test_read_file_base64_small_chunk_size(self, tmp_path):
+        """Test that chunk sizes that are multiples of 3 encode correctly."""
+        data = b"workspace-agent"
+        file_path = tmp_path / "data.bin"
+        file_path.write_bytes(data)
+
+        result = read_file_base64(file_path, chunk_size=3)
+        assert result == base64.b64encode(data).decode("ascii")
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import json
+import os
+import stat
+import sys
+import threading
 from pathlib import Path
 from unittest.mock import patch
 
@@ -82,6 +86,91 @@ class TestWorkspace:
         assert data["name"] == "test"
         assert data["version"] == __version__
 
+    def test_save_does_not_leave_temporary_file(self, tmp_path):
+        """Test that save replaces the config without leaving a temporary file."""
+        workspace = Workspace(
+            name="test",
+            path=tmp_path / "test",
+            workspaces_path=tmp_path,
+        )
+        workspace.save()
+        config_path = workspace.save()
+
+        assert [p.name for p in workspace.path.iterdir()] == ["workspace.json"]
+        assert json.loads(config_path.read_text())["name"] == "test"
+
+    def test_save_failure_removes_temporary_file(self, tmp_path):
+        """Test that a failed save leaves neither a temporary file nor a config."""
+        workspace = Workspace(
+            name="test",
+            path=tmp_path / "test",
+            workspaces_path=tmp_path,
+        )
+
+        with patch(
+            "wa.workspace.models.workspace.os.replace",
+            side_effect=OSError("disk full"),
+        ):
+            with pytest.raises(OSError, match="disk full"):
+                workspace.save()
+
+        assert list(workspace.path.iterdir()) == []
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+    def test_save_uses_default_file_mode(self, tmp_path):
+        """Test that a new config gets the umask's default mode, not 0600."""
+        workspace = Workspace(
+            name="test",
+            path=tmp_path / "test",
+            workspaces_path=tmp_path,
+        )
+
+        with patch("wa.workspace.models.workspace._UMASK", 0o022):
+            config_path = workspace.save()
+
+        assert stat.S_IMODE(config_path.stat().st_mode) == 0o644
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+    def test_save_preserves_existing_file_mode(self, tmp_path):
+        """Test that saving over an existing config keeps its mode."""
+        workspace = Workspace(
+            name="test",
+            path=tmp_path / "test",
+            workspaces_path=tmp_path,
+        )
+        config_path = workspace.save()
+        config_path.chmod(0o640)
+
+        workspace.save()
+
+        assert stat.S_IMODE(config_path.stat().st_mode) == 0o640
+
+    def test_save_concurrent_writers(self, tmp_path):
+        """Test that concurrent saves to one config don't collide."""
+        workspace = Workspace(
+            name="test",
+            path=tmp_path / "test",
+            workspaces_path=tmp_path,
+        )
+        errors = []
+
+        def save_repeatedly():
+            try:
+                for _ in range(50):
+                    workspace.save()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=save_repeatedly) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert [p.name for p in workspace.path.iterdir()] == ["workspace.json"]
+        assert Workspace.load(workspace.path / "workspace.json").name == "test"
+
     def test_save_custom_path(self, tmp_path):
         """Test that save can use a custom path."""
         workspace = Workspace(name="test", path=tmp_path / "test")
@@ -97,6 +186,62 @@ class TestWorkspace:
         assert config_path.exists()
         assert config_path.parent.exists()
 
+    def test_deferred_save_writes_once(self, tmp_path):
+        """Test that deferred_save batches saves into one write on exit."""
+        workspace = Workspace(
+            name="test",
+            path=tmp_path / "test",
+            workspaces_path=tmp_path,
+        )
+        workspace.save()
+
+        with patch(
+            "wa.workspace.models.workspace.os.replace", side_effect=os.replace
+        ) as mock_write:
+            with workspace.deferred_save():
+                workspace.create_folder("folder1")
+                workspace.create_folder(["folder2", "nested"])
+                assert mock_write.call_count == 0
+
+        assert mock_write.call_count == 1
+        loaded = Workspace.load(workspace.path / "workspace.json")
+        assert set(loaded.folders) == {"folder1", "folder2"}
+
+    def test_deferred_save_saves_on_error(self, tmp_path):
+        """Test that deferred_save still records folders when the block raises."""
+        workspace = Workspace(
+            name="test",
+            path=tmp_path / "test",
+            workspaces_path=tmp_path,
+        )
+        workspace.save()
+
+        with pytest.raises(RuntimeError):
+            with workspace.deferred_save():
+                workspace.create_folder("folder1")
+                raise RuntimeError
+
+        loaded = Workspace.load(workspace.path / "workspace.json")
+        assert "folder1" in loaded.folders
+
+    def test_deferred_save_explicit_path_keeps_pending_save(self, tmp_path):
+        """Test that saving to another path inside the block still writes the config."""
+        workspace = Workspace(
+            name="test",
+            path=tmp_path / "test",
+            workspaces_path=tmp_path,
+        )
+        workspace.save()
+        backup_path = tmp_path / "backup.json"
+
+        with workspace.deferred_save():
+            workspace.create_folder("folder1")
+            workspace.save(backup_path)
+
+        assert "folder1" in Workspace.load(backup_path).folders
+        loaded = Workspace.load(workspace.path / "workspace.json")
+        assert "folder1" in loaded.folders
+
     def test_load_workspace(self, tmp_path):
         """Test that workspace can be loaded from file."""
         workspace = Workspace(
@@ -260,6 +405,43 @@ class TestWorkspace:
 
         assert result.files == ["file1.txt", "file2.txt"]
 
+    def test_create_folder_nested_sanitizes_parent_names(self, tmp_path):
+        """Test that create_folder sanitizes every name in a nested list."""
+        workspace = Workspace(name="test", path=tmp_path / "test")
+        workspace.path.mkdir(parents=True, exist_ok=True)
+
+        result = workspace.create_folder(name_or_path=["my parent", "my child"])
+
+        assert "my_parent" in workspace.folders
+        assert result.name == "my_child"
+        assert result.path == workspace.path / "my_parent" / "my_child"
+        assert result.path.exists()
+
+    def test_create_folder_nested_kwargs_apply_to_deepest(self, tmp_path):
+        """Test that create_folder passes kwargs to the deepest nested folder."""
+        workspace = Workspace(name="test", path=tmp_path / "test")
+        workspace.path.mkdir(parents=True, exist_ok=True)
+
+        result = workspace.create_folder(
+            name_or_path=["parent", "child"], files=["file1.txt"]
+        )
+
+        assert result.files == ["file1.txt"]
+        assert workspace.folders["parent"].files == []
+
+    def test_create_folder_returns_deepest_kwargs_folder(self, tmp_path):
+        """Test that create_folder descends into folders passed through kwargs."""
+        workspace = Workspace(name="test", path=tmp_path / "test")
+        workspace.path.mkdir(parents=True, exist_ok=True)
+
+        result = workspace.create_folder(
+            name_or_path=["parent", "child"], folders=["grandchild"]
+        )
+
+        assert result.name == "grandchild"
+        assert result.path == workspace.path / "parent" / "child" / "grandchild"
+        assert result.path.is_dir()
+
     def test_get_deepest_folder_simple(self, tmp_path):
         """Test _get_deepest_folder with a simple folder."""
         workspace = Workspace(name="test", path=tmp_path / "test")
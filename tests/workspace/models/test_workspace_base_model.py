@@ -120,6 +120,22 @@ class TestWorkspaceBaseModel:
         assert "dict_folder" in model.folders
         assert "string_folder" in model.folders
 
+    def test_parse_folders_keys_use_sanitized_names(self):
+        """Test that string and dict folders are keyed by their sanitized name."""
+        folders = ["my folder", {"name": "other folder"}]
+        model = WorkspaceBaseModel(name="test", folders=folders)
+        assert list(model.folders) == ["my_folder", "other_folder"]
+        assert model.folders["my_folder"].name == "my_folder"
+        assert model.folders["other_folder"].name == "other_folder"
+
+    def test_parse_folders_string_defaults(self):
+        """Test that folders given as strings get default field values."""
+        model = WorkspaceBaseModel(name="test", folders=["folder1"])
+        folder = model.folders["folder1"]
+        assert folder.path == Path("")
+        assert folder.folders == {}
+        assert folder.files == []
+
     def test_folders_preserve_nested_structure(self):
         """Test that nested folder structures are preserved."""
         nested_folder = WorkspaceFolder(
@@ -61,6 +61,20 @@ class TestCreateWorkspace:
                 force=False,
             )
 
+    def test_create_workspace_existing_sanitized_name_raises_error(self, tmp_path):
+        """Test that the existence check uses the sanitized workspace name."""
+        workspaces_path = tmp_path / "workspaces"
+        create_workspace(
+            workspace_name="my workspace",
+            workspaces_path=workspaces_path,
+        )
+
+        with pytest.raises(FileExistsError, match="Workspace already exists"):
+            create_workspace(
+                workspace_name="my workspace",
+                workspaces_path=workspaces_path,
+            )
+
     def test_create_workspace_with_force_overwrites_existing(self, tmp_path):
         """Test that create_workspace with force=True overwrites existing workspace."""
         workspaces_path = tmp_path / "workspaces"
@@ -296,6 +310,20 @@ class TestCreateWorkspaceFolder:
         assert folder.name == "folder"
         assert folder.path == workspace_path / "folder"
 
+    def test_create_workspace_folder_missing_config_raises_error(self, tmp_path):
+        """Test that a workspace folder without a config is not recreated."""
+        workspaces_path = tmp_path / "workspaces"
+        (workspaces_path / "no_config").mkdir(parents=True)
+
+        with pytest.raises(FileNotFoundError):
+            create_workspace_folder(
+                name_or_path="folder",
+                workspace_name="no_config",
+                workspaces_path=workspaces_path,
+            )
+
+        assert not (workspaces_path / "no_config" / "folder").exists()
+
     def test_create_workspace_folder_single_item_list(self, tmp_path):
         """Test that create_workspace_folder handles single-item list."""
         workspaces_path = tmp_path / "workspaces"
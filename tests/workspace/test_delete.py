@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import subprocess
+import sys
+
 from pathlib import Path
 from unittest.mock import patch
 
@@ -119,7 +122,7 @@ class TestDeleteWorkspace:
         )
         workspace.save()
 
-        with patch("wa.workspace.read.get_project_root", return_value=tmp_path):
+        with patch("wa.workspace.delete.get_project_root", return_value=tmp_path):
             delete_workspace(workspace_name="test_workspace")
 
         assert not workspace.path.exists()
@@ -304,3 +307,102 @@ class TestDeleteWorkspace:
         assert not symlink.exists()
         # Target file should still exist
         assert target_file.exists()
+
+    def test_delete_workspace_force_does_not_load_config(self, tmp_path):
+        """Test that delete_workspace with force skips loading the workspace."""
+        workspaces_path = tmp_path / "workspaces"
+        workspace = Workspace(
+            name="test_workspace",
+            workspaces_path=workspaces_path,
+            folders=[WorkspaceFolder(name="folder1")],
+        )
+        workspace.save()
+
+        with patch("wa.workspace.delete.json.loads") as mock_loads:
+            deleted_path = delete_workspace(
+                workspace_name="test_workspace",
+                workspaces_path=workspaces_path,
+                force=True,
+            )
+
+        mock_loads.assert_not_called()
+        assert deleted_path == workspace.path
+        assert not workspace.path.exists()
+
+    def test_delete_workspace_does_not_validate_config(self, tmp_path):
+        """Test that delete_workspace checks folders without building a Workspace."""
+        workspaces_path = tmp_path / "workspaces"
+        workspace = Workspace(
+            name="test_workspace",
+            workspaces_path=workspaces_path,
+        )
+        workspace.save()
+
+        with patch.object(Workspace, "model_validate_json") as mock_validate:
+            deleted_path = delete_workspace(
+                workspace_name="test_workspace",
+                workspaces_path=workspaces_path,
+            )
+
+        mock_validate.assert_not_called()
+        assert deleted_path == workspace.path
+        assert not workspace.path.exists()
+
+    def test_delete_workspace_force_nonexistent_workspace_raises_error(self, tmp_path):
+        """Test that delete_workspace with force still requires a workspace config."""
+        workspaces_path = tmp_path / "workspaces"
+        (workspaces_path / "not_a_workspace").mkdir(parents=True)
+
+        with pytest.raises(FileNotFoundError):
+            delete_workspace(
+                workspace_name="not_a_workspace",
+                workspaces_path=workspaces_path,
+                force=True,
+            )
+
+        assert (workspaces_path / "not_a_workspace").exists()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Uses POSIX `rm`")
+    def test_delete_workspace_fast_delete(self, tmp_path, monkeypatch):
+        """Test that WA_FAST_DELETE=1 removes the workspace with `rm -rf`."""
+        monkeypatch.setenv("WA_FAST_DELETE", "1")
+        workspaces_path = tmp_path / "workspaces"
+        workspace = Workspace(
+            name="test_workspace",
+            workspaces_path=workspaces_path,
+            folders=[WorkspaceFolder(name="folder1")],
+        )
+        workspace.save()
+
+        with patch(
+            "wa.workspace.delete.subprocess.run", wraps=subprocess.run
+        ) as mock_run:
+            delete_workspace(
+                workspace_name="test_workspace",
+                workspaces_path=workspaces_path,
+                force=True,
+            )
+
+        mock_run.assert_called_once_with(
+            ["rm", "-rf", "--", str(workspace.path)], check=True
+        )
+        assert not workspace.path.exists()
+
+    def test_delete_workspace_uses_rmtree_by_default(self, tmp_path, monkeypatch):
+        """Test that shutil.rmtree is used unless WA_FAST_DELETE=1."""
+        monkeypatch.delenv("WA_FAST_DELETE", raising=False)
+        workspaces_path = tmp_path / "workspaces"
+        workspace = Workspace(
+            name="test_workspace",
+            workspaces_path=workspaces_path,
+        )
+        workspace.save()
+
+        with patch("wa.workspace.delete.subprocess.run") as mock_run:
+            delete_workspace(
+                workspace_name="test_workspace",
+                workspaces_path=workspaces_path,
+            )
+
+        mock_run.assert_not_called()
+        assert not workspace.path.exists()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
@@ -64,11 +65,7 @@ class TestListWorkspaces:
         assert "workspace2" in result
 
     def test_list_workspaces_ignores_directories_without_config(self, tmp_path):
-        """Test that list_workspaces only includes directories with workspace.json.
-
-        Note: The current implementation has a bug where it returns all directories,
-        not just those with workspace.json. This test documents expected behavior.
-        """
+        """Test that list_workspaces only includes directories with workspace.json."""
         workspaces_path = tmp_path / "workspaces"
         workspaces_path.mkdir(parents=True)
 
@@ -84,10 +81,7 @@ class TestListWorkspaces:
 
         result = list_workspaces(workspaces_path=workspaces_path)
 
-        # Current implementation returns both, but ideally should only return valid_workspace
-        # This test documents the current behavior
-        assert "valid_workspace" in result
-        assert "invalid_workspace" in result  # Bug: should not be included
+        assert result == ["valid_workspace"]
 
     def test_list_workspaces_ignores_files(self, tmp_path):
         """Test that list_workspaces ignores files in the workspaces directory."""
@@ -109,6 +103,20 @@ class TestListWorkspaces:
         assert "workspace1" in result
         assert "not_a_workspace.txt" not in result
 
+    @pytest.mark.skipif(sys.platform == "win32", reason="Requires symlink support")
+    def test_list_workspaces_includes_symlinked_workspace(self, tmp_path):
+        """Test that symlinks to workspace directories are listed."""
+        workspaces_path = tmp_path / "workspaces"
+        Workspace(name="real", workspaces_path=workspaces_path).save()
+
+        # Workspace stored elsewhere and linked into the workspaces folder
+        Workspace(name="linked", workspaces_path=tmp_path / "elsewhere").save()
+        (workspaces_path / "linked").symlink_to(tmp_path / "elsewhere" / "linked")
+
+        result = list_workspaces(workspaces_path=workspaces_path)
+
+        assert sorted(result) == ["linked", "real"]
+
     def test_list_workspaces_with_default_path(self, tmp_path):
         """Test that list_workspaces uses default path when not specified."""
         workspace = Workspace(
@@ -201,5 +209,55 @@ class TestListWorkspaces:
 
         result = list_workspaces(workspaces_path=workspaces_path)
 
-        # Current implementation includes directories without config
-        assert "empty_dir" in result
+        assert "empty_dir" not in result
+
+    def test_list_workspaces_returns_only_configured_workspaces(self, tmp_path):
+        """Test that list_workspaces returns exactly the directories with a config."""
+        workspaces_path = tmp_path / "workspaces"
+
+        for name in ["alpha", "beta", "gamma"]:
+            Workspace(name=name, workspaces_path=workspaces_path).save()
+
+        for name in ["no_config_1", "no_config_2"]:
+            (workspaces_path / name).mkdir()
+
+        result = list_workspaces(workspaces_path=workspaces_path)
+
+        assert sorted(result) == ["alpha", "beta", "gamma"]
+
+    def test_list_workspaces_many_directories_with_max_workers(self, tmp_path):
+        """Test that concurrent config checks keep order and filter directories."""
+        workspaces_path = tmp_path / "workspaces"
+
+        expected = []
+        for i in range(30):
+            if i % 3 == 0:
+                (workspaces_path / f"dir_{i:02d}").mkdir(parents=True)
+            else:
+                Workspace(name=f"dir_{i:02d}", workspaces_path=workspaces_path).save()
+                expected.append(f"dir_{i:02d}")
+
+        result = list_workspaces(workspaces_path=workspaces_path, max_workers=4)
+
+        assert sorted(result) == expected
+
+    def test_list_workspaces_serial_by_default(self, tmp_path):
+        """Test that no thread pool is started unless max_workers is given."""
+        workspaces_path = tmp_path / "workspaces"
+        for i in range(30):
+            Workspace(name=f"dir_{i:02d}", workspaces_path=workspaces_path).save()
+
+        with patch("wa.workspace.list.ThreadPoolExecutor") as mock_executor:
+            result = list_workspaces(workspaces_path=workspaces_path)
+
+        mock_executor.assert_not_called()
+        assert len(result) == 30
+
+    @pytest.mark.parametrize("max_workers", [0, -1])
+    def test_list_workspaces_rejects_invalid_max_workers(self, tmp_path, max_workers):
+        """Test that max_workers below 1 raises, even with few directories."""
+        workspaces_path = tmp_path / "workspaces"
+        Workspace(name="alpha", workspaces_path=workspaces_path).save()
+
+        with pytest.raises(ValueError, match="max_workers must be at least 1"):
+            list_workspaces(workspaces_path=workspaces_path, max_workers=max_workers)
@@ -87,6 +87,16 @@ class TestWorkspaceFileResource:
         assert "error" in result
         assert "File not found" in result["error"]
 
+    def test_file_not_found_below_file(self, workspace_file_resource, tmp_path):
+        """Test handling of a path that treats a file as a directory."""
+        parent_file = tmp_path / "file.txt"
+        parent_file.write_text("content")
+
+        result = workspace_file_resource(path=str(parent_file / "image.png"))
+
+        assert "error" in result
+        assert "File not found" in result["error"]
+
     def test_path_is_directory(self, workspace_file_resource, tmp_path):
         """Test handling when path is a directory."""
         directory = tmp_path / "test_dir"
@@ -156,6 +156,27 @@ class TestReadWorkspace:
         assert "file1.txt" in loaded.folders["folder1"].files
         assert "file2.txt" in loaded.folders["folder1"].files
 
+    def test_read_workspace_include_files_excludes_directories(self, tmp_path):
+        """Test that include_files only lists files, not folders."""
+        workspaces_path = tmp_path / "workspaces"
+        workspace = Workspace(
+            name="test_workspace",
+            workspaces_path=workspaces_path,
+            folders=[WorkspaceFolder(name="folder1")],
+        )
+        workspace.save()
+        (workspace.path / "folder1").mkdir()
+        (workspace.path / "notes.txt").write_text("content")
+
+        loaded = read_workspace(
+            workspace_name="test_workspace",
+            workspaces_path=workspaces_path,
+            include_files=True,
+        )
+
+        assert sorted(loaded.files) == ["notes.txt", "workspace.json"]
+        assert loaded.folders["folder1"].files == []
+
     def test_read_workspace_with_include_files_nested(self, tmp_path):
         """Test that read_workspace populates files recursively in nested folders."""
         workspaces_path = tmp_path / "workspaces"